@@ -1,6 +1,4 @@
-from inspect import signature
-
-from agent_utils.base_agent import BaseAgentBuilder
+from agent_utils.base_agent import BaseAgentBuilder, make_component
 from concordia.components import agent as ext_components
 
 # Default probabilities for different Mastodon operations
@@ -140,12 +138,7 @@ class AgentBuilder(BaseAgentBuilder):
             # check for and add dependencies
             if name in dependencies:
                 settings["components"] = dependencies[name]
-            if "model" in signature(component_constructor.__init__).parameters.keys():
-                settings["model"] = model
-            if "model" in signature(component_constructor.__bases__[0].__init__).parameters.keys():
-                settings["model"] = model
-
-            z[name] = component_constructor(**settings)
+            z[name] = make_component(component_constructor, model, settings)
 
         # set order: base then custom, but election information first, and action suggester last
         component_order = base_component_order[:-1] + component_order + [base_component_order[-1]]
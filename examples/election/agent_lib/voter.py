@@ -1,7 +1,8 @@
-from inspect import signature
+import re
 
-from agent_utils.base_agent import BaseAgentBuilder
+from agent_utils.base_agent import BaseAgentBuilder, make_component
 from concordia.components import agent as ext_components
+from concordia.memory_bank import legacy_associative_memory
 
 # Default probabilities for different Mastodon operations
 ACTION_PROBABILITIES = {
@@ -23,6 +24,21 @@ ACTION_PROBABILITIES = {
 }
 
 NUM_MEMORIES = 10
+# number of most recent memories scanned for a candidate mention before refreshing an opinion
+NUM_MEMORIES_FOR_ACTIVATION = 10
+# number of steps after which an opinion is refreshed even if its candidate has not come up
+MAX_OPINION_AGE = 5
+
+# question templates: {candidate} is filled once per component, while {agent_name}
+# (and {query}) are left for the concordia components to fill in at query time
+_RELEVANT_Q_TMPL = "Given the following statements, what does {agent_name} think of the {query}?"
+_OPINION_Q_TMPL = (
+    "Given {{agent_name}}'s opinion about candidate {candidate}, and the recent observations,"
+    "what are some current thoughts that {{agent_name}} is having about candidate {candidate}? "
+    "Consider how recent observations may or may not have changed this opinion based of the persona of the agent."
+)
+_OPINION_ANSWER_PREFIX_TMPL = "{{agent_name}}'s current opinion on candidate {candidate} is"
+_RELEVANT_QUERY_TMPL = "policies and actions of {candidate}"
 
 
 # define custom component classes
@@ -35,9 +51,48 @@ class RelevantOpinions(
 
 
 class OpinionsOnCandidate(ext_components.question_of_recent_memories.QuestionOfRecentMemories):
-    def __init__(self, name, *args, **kwargs):
+    """Opinion on a candidate that is only refreshed once the candidate comes up.
+
+    Until the candidate (first or last name, as a whole word) appears in the agent's
+    most recent memories, the LLM query (and that of its RelevantOpinion dependency)
+    is skipped and the last opinion formed is reused, for at most `MAX_OPINION_AGE`
+    steps.
+    """
+
+    def __init__(self, name, candidate, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.name = name
+        self._candidate_re = re.compile(
+            r"\b(?:" + "|".join(re.escape(token) for token in candidate.split()) + r")\b"
+        )
+        self._last_opinion = None
+        self._opinion_age = 0
+
+    def _candidate_is_active(self) -> bool:
+        memory = self.get_entity().get_component(
+            self._memory_component_name,
+            type_=ext_components.memory_component.MemoryComponent,
+        )
+        recent_text = "\n".join(
+            mem.text
+            for mem in memory.retrieve(
+                scoring_fn=legacy_associative_memory.RetrieveRecent(),
+                limit=NUM_MEMORIES_FOR_ACTIVATION,
+            )
+        )
+        return self._candidate_re.search(recent_text) is not None
+
+    def _make_pre_act_value(self) -> str:
+        if (
+            self._last_opinion is not None
+            and self._opinion_age < MAX_OPINION_AGE
+            and not self._candidate_is_active()
+        ):
+            self._opinion_age += 1
+            return self._last_opinion
+        self._last_opinion = super()._make_pre_act_value()
+        self._opinion_age = 0
+        return self._last_opinion
 
 
 # derive build class, filling out agent-specific methods
@@ -113,34 +168,24 @@ class AgentBuilder(BaseAgentBuilder):
                 settings["num_memories_to_retrieve"] = NUM_MEMORIES
                 settings["name"] = name
                 for candidate in candidates:
+                    template_args = {"candidate": candidate}
                     if name == candidate + "RelevantOpinion":
-                        settings["queries"] = [f"policies and actions of {candidate}"]
-                        settings["question"] = (
-                            f"Given the following statements, what does {agent_name} think of the {{query}}?"
-                        )
+                        settings["queries"] = [_RELEVANT_QUERY_TMPL.format_map(template_args)]
+                        settings["question"] = _RELEVANT_Q_TMPL
                         settings["model"] = model
                         component_constructor = RelevantOpinions
                     elif name == candidate + "OpinionOnCandidate":
-                        settings["answer_prefix"] = (
-                            f"{agent_name}'s current opinion on candidate {candidate} is"
-                        )
-                        settings["question"] = "".join(
-                            [
-                                f"Given {agent_name}'s opinion about candidate {candidate}, and the recent observations,",
-                                f"what are some current thoughts that {agent_name} is having about candidate {candidate}? ",
-                                "Consider how recent observations may or may not have changed this opinion based of the persona of the agent.",
-                            ]
+                        settings["candidate"] = candidate
+                        settings["answer_prefix"] = _OPINION_ANSWER_PREFIX_TMPL.format_map(
+                            template_args
                         )
+                        settings["question"] = _OPINION_Q_TMPL.format_map(template_args)
                         component_constructor = OpinionsOnCandidate
 
             # check for and add dependencies
             if name in dependencies:
                 settings["components"] = dependencies[name]
-            if "model" in signature(component_constructor.__init__).parameters.keys():
-                settings["model"] = model
-            if "model" in signature(component_constructor.__bases__[0].__init__).parameters.keys():
-                settings["model"] = model
-            z[name] = component_constructor(**settings)
+            z[name] = make_component(component_constructor, model, settings)
 
         # set order: base then custom, but election information first, and action suggester last
         component_order = base_component_order[:-1] + component_order + [base_component_order[-1]]
@@ -2,6 +2,9 @@ import re
 
 from sim_utils.agent_speech_utils import AgentQuery
 
+_FAV_RE = re.compile(r"\b([1-9]|10)\b")
+_YESNO_RE = re.compile(r"\b(yes|no)\b", re.IGNORECASE)
+
 
 class VotePref(AgentQuery):
     def __init__(self, query_data=None):  # query_text,
@@ -26,14 +29,24 @@ class VotePref(AgentQuery):
         # }
         self.query_data_cls = query_data
         super().__init__(query_data)
+        # first or last name of either candidate -> that candidate's first name
+        self._token_to_candidate = {}
+        for candidate in (
+            query_data["interaction_premise_template"]["candidate1"],
+            query_data["interaction_premise_template"]["candidate2"],
+        ):
+            c_name = candidate.split()
+            for token in c_name[:2]:
+                self._token_to_candidate.setdefault(token, c_name[0])
+        self._candidate_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self._token_to_candidate)) + r")\b"
+        )
 
     def parse_answer(self, agent_says):
-        c_name1 = self.query_data_cls["interaction_premise_template"]["candidate1"].split()
-        c_name2 = self.query_data_cls["interaction_premise_template"]["candidate2"].split()
-        if (c_name1[0] in agent_says) or (c_name1[1] in agent_says):
-            return c_name1[0]
-        if (c_name2[0] in agent_says) or (c_name2[1] in agent_says):
-            return c_name2[0]
+        # the candidate named first in the answer is the vote
+        match = self._candidate_re.search(agent_says)
+        if match:
+            return self._token_to_candidate[match.group(1)]
         return "Invalid Answer"
 
 
@@ -61,9 +74,7 @@ class Favorability(AgentQuery):
         super().__init__(query_data)
 
     def parse_answer(self, agent_says):
-        pattern = r"\b([1-9]|10)\b"
-        # Search for the pattern in the string
-        match = re.search(pattern, agent_says)
+        match = _FAV_RE.search(agent_says)
         if match:
             return match.group()
         return None
@@ -85,8 +96,7 @@ class VoteIntent(AgentQuery):
         super().__init__(query_data)
 
     def parse_answer(self, agent_says):
-        if "yes" in agent_says.lower():
-            return "Yes"
-        if "no" in agent_says.lower():
-            return "No"
+        match = _YESNO_RE.search(agent_says)
+        if match:
+            return match.group(1).capitalize()
         return None
@@ -210,6 +210,24 @@ BASE_FOLLOWERSHIP_CONNECTION_PROBABILITY = 0.4
 
 QUERY_LIB_MODULE = "config_utils.agent_query_lib"
 
+# Big5 trait names in agent configs, mapped to their labels in the persona file
+BIG5_TRAIT_LABELS = {
+    "openness": "Openness",
+    "conscientiousness": "Conscientiousness",
+    "extraversion": "Extraversion",
+    "agreeableness": "Agreeableness",
+    "neuroticism": "Neuroticism",
+}
+DEFAULT_BIG5_SCORE = 5
+# Big5 scores of the two candidates, in PARTISAN_TYPES order
+CANDIDATE_BIG5_TRAIT_SCORES = {
+    "openness": [3, 9],
+    "conscientiousness": [8, 7],
+    "extraversion": [6, 8],
+    "agreeableness": [5, 8],
+    "neuroticism": [4, 5],
+}
+
 
 def get_followership_connection_stats(roles):
     # initial follower network statistics
@@ -225,6 +243,35 @@ def get_followership_connection_stats(roles):
     return p_from_to
 
 
+# news agent config settings, by news type
+NEWS_INFO = {
+    "local": {
+        "name": "Storhampton Gazette",
+        "type": "local",
+        "coverage": "local news",
+        "schedule": "hourly",
+        "mastodon_username": "storhampton_gazette",
+        "seed_toot": "Good morning, Storhampton! Tune in for the latest local news updates.",
+    },
+    "national": {
+        "name": "National News Network",
+        "type": "national",
+        "coverage": "national news",
+        "schedule": "hourly",
+        "mastodon_username": "national_news_network",
+        "seed_toot": "Good morning, Storhampton! Tune in for the latest national news updates.",
+    },
+    "international": {
+        "name": "Global News Network",
+        "type": "international",
+        "coverage": "international news",
+        "schedule": "hourly",
+        "mastodon_username": "global_news_network",
+        "seed_toot": "Good morning, Storhampton! Tune in for the latest international news updates.",
+    },
+}
+
+
 # generate news agent configs
 def get_news_agent_configs(n_agents, news=None, include_images=True):
     news_types = ["local", "national", "international"]
@@ -232,57 +279,27 @@ def get_news_agent_configs(n_agents, news=None, include_images=True):
     # Limit the news types to the first n_agent elements
     news_types = news_types[:n_agents]
 
-    # Create news agent config settings
-    news_info = {
-        "local": {
-            "name": "Storhampton Gazette",
-            "type": "local",
-            "coverage": "local news",
-            "schedule": "hourly",
-            "mastodon_username": "storhampton_gazette",
-            "seed_toot": "Good morning, Storhampton! Tune in for the latest local news updates.",
-        },
-        "national": {
-            "name": "National News Network",
-            "type": "national",
-            "coverage": "national news",
-            "schedule": "hourly",
-            "mastodon_username": "national_news_network",
-            "seed_toot": "Good morning, Storhampton! Tune in for the latest national news updates.",
-        },
-        "international": {
-            "name": "Global News Network",
-            "type": "international",
-            "coverage": "international news",
-            "schedule": "hourly",
-            "mastodon_username": "global_news_network",
-            "seed_toot": "Good morning, Storhampton! Tune in for the latest international news updates.",
-        },
-    }
-
     news_agent_configs = []
     for i, news_type in enumerate(news_types):
-        agent = news_info[news_type].copy()
+        agent = NEWS_INFO[news_type].copy()
         agent["role_dict"] = {"name": "exogenous"}
         agent["goal"] = None
         agent["bio"] = (
-            f"Providing {news_info[news_type]['coverage']} to the users of Storhampton.social."  # currently not used since read_bio not one of available actions
+            f"Providing {NEWS_INFO[news_type]['coverage']} to the users of Storhampton.social."  # currently not used since read_bio not one of available actions
         )
         agent["context"] = ""
         agent["seed_toot"] = (
-            news_info[news_type]["seed_toot"] if "seed_toot" in news_info[news_type] else ""
+            NEWS_INFO[news_type]["seed_toot"] if "seed_toot" in NEWS_INFO[news_type] else ""
         )
 
         if news is not None:
-            agent["posts"] = {
-                k: [img for img in v] if include_images else [] for k, v in news.items()
-            }
+            agent["posts"] = {k: list(v) if include_images else [] for k, v in news.items()}
 
         agent["toot_posting_schedule"] = generate_news_agent_toot_post_times(agent)
 
         news_agent_configs.append(agent)
 
-    return news_agent_configs, {k: news_info[k] for k in news_types}
+    return news_agent_configs, {k: NEWS_INFO[k] for k in news_types}
 
 
 def generate_news_agent_toot_post_times(agent):
@@ -355,17 +372,23 @@ def generate_output_configs(cfg):
     roles.append("voter")
     with open("examples/election/input/personas/" + agents["inputs"]["persona_file"]) as f:
         persona_rows = json.load(f)
-    voter_configs = []
-    for row in persona_rows[: num_agents - len(candidate_configs)]:
-        agent = {}
-        agent["name"] = row["Name"]
-        agent["gender"] = row["Sex"].lower()
-        agent["context"] = row["context"]
-        agent["party"] = ""  # row.get("Political_Identity", "")
-        agent["seed_toot"] = ""
-        agent["role_dict"] = {"name": "voter", "module_path": "agent_lib.voter"}
-        agent["goal"] = "Their goal is have a good day and vote in the election."
-        voter_configs.append(agent)
+    num_voters = num_agents - len(candidate_configs)
+    if num_voters > len(persona_rows):
+        print(f"override num_agents: only {len(persona_rows)} voter personas available")
+    voter_rows = persona_rows[:num_voters]
+    voter_goal = "Their goal is have a good day and vote in the election."
+    voter_configs = [
+        {
+            "name": row["Name"],
+            "gender": row["Sex"].lower(),
+            "context": row["context"],
+            "party": "",  # row.get("Political_Identity", "")
+            "seed_toot": "",
+            "role_dict": {"name": "voter", "module_path": "agent_lib.voter"},
+            "goal": voter_goal,
+        }
+        for row in voter_rows
+    ]
 
     # add custom setting-specific agent features
     if experiment_name == "independent":
@@ -410,29 +433,16 @@ def generate_output_configs(cfg):
                 agent.update(malicious_actor_config)
 
     # add big5 trait information
-    if persona_type.split(".")[1] == "Big5":
-        candidate_trait_scores = {
-            "openness": [3, 9],
-            "conscientiousness": [8, 7],
-            "extraversion": [6, 8],
-            "agreeableness": [5, 8],
-            "neuroticism": [4, 5],
-        }
-        for nit in range(2):
-            candidate_configs[nit]["traits"] = dict(
-                zip(
-                    candidate_trait_scores.keys(),
-                    [val[nit] for val in candidate_trait_scores.values()],
-                    strict=False,
-                )
-            )
-        for rit, row in enumerate(persona_rows[: num_agents - len(candidate_configs)]):
-            voter_configs[rit]["traits"] = {
-                "openness": row["Big5_traits"].get("Openness", 5),
-                "conscientiousness": row["Big5_traits"].get("Conscientiousness", 5),
-                "extraversion": row["Big5_traits"].get("Extraversion", 5),
-                "agreeableness": row["Big5_traits"].get("Agreeableness", 5),
-                "neuroticism": row["Big5_traits"].get("Neuroticism", 5),
+    if persona_type.rpartition(".")[2] == "Big5":
+        for nit, agent in enumerate(candidate_configs):
+            agent["traits"] = {
+                trait: scores[nit] for trait, scores in CANDIDATE_BIG5_TRAIT_SCORES.items()
+            }
+        for agent, row in zip(voter_configs, voter_rows, strict=True):
+            big5_traits = row["Big5_traits"]
+            agent["traits"] = {
+                trait: big5_traits.get(label, DEFAULT_BIG5_SCORE)
+                for trait, label in BIG5_TRAIT_LABELS.items()
             }
     else:
         print("Choose valid trait type")
@@ -477,7 +487,7 @@ def generate_output_configs(cfg):
     soc_sys_context["gamemaster_memories"] = gamemaster_memories
     soc_sys_context["setting_info"] = {
         "description": "\n".join(
-            [CANDIDATE_INFO[p]["policy_proposals"] for p in list(CANDIDATE_INFO.keys())]
+            candidate["policy_proposals"] for candidate in CANDIDATE_INFO.values()
         ),
         "details": {
             "candidate_info": CANDIDATE_INFO,
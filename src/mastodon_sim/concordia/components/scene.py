@@ -14,6 +14,7 @@
 
 """A GameMaster that simulates a player's interaction with their phone."""
 
+import json
 import re
 import threading
 
@@ -37,11 +38,11 @@ from concordia.language_model import language_model
 from concordia.thought_chains import thought_chains
 from concordia.typing import agent, component
 from concordia.typing.entity import OutputType
+from sim_utils.misc_sim_utils import ConfigStore
 
 from mastodon_sim import mastodon_ops
 from mastodon_sim.concordia.components import apps, logging
 from mastodon_sim.concordia.components.apps import COLOR_TYPE
-from sim.sim_utils.misc_sim_utils import ConfigStore
 
 file_lock = threading.Lock()
 
@@ -187,7 +188,7 @@ class _PhoneComponent(component.Component):
                         name=self._player.name,
                     )
                     call_to_action = (
-                        f"{media_contents!s} Context: Sussinctly describe this image in the form of an impression that it made on {self._player.name.split()[0]} when they viewed it alongside the following text of the toot they just read on the Mastodon app: "
+                        f"{json.dumps(media_contents)} Context: Sussinctly describe this image in the form of an impression that it made on {self._player.name.split()[0]} when they viewed it alongside the following text of the toot they just read on the Mastodon app: "
                         + "'"
                         + toot_headline
                         + "'"
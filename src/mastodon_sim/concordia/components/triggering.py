@@ -22,9 +22,9 @@ from concordia.associative_memory import associative_memory, blank_memories
 from concordia.clocks import game_clock
 from concordia.language_model import language_model
 from concordia.typing import component
+from sim_utils.misc_sim_utils import ConfigStore
 
 from mastodon_sim.concordia.components import apps, logging, scene
-from sim.sim_utils.misc_sim_utils import ConfigStore
 
 
 class BasicSceneTriggeringComponent(component.Component):
@@ -1,6 +1,6 @@
 import datetime
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from concordia.associative_memory import (
     associative_memory,
@@ -54,21 +54,30 @@ class GameMaster:
         self.importance_model_gm = importance_model_gm
         self.agent_components = self._create_agent_components()
         self.log_data = []
+        # one worker per agent, kept across steps. An agent still acting when a step's deadline
+        # passes keeps its worker and sits out later steps until it is done (see `step`), so
+        # the pool never runs short and no agent acts twice at once
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.agents)), thread_name_prefix="agent-step"
+        )
+        self._late = {}  # agent name -> future of a step it overran
 
     def _create_agent_components(self):
         """Create a unique SceneTriggeringComponent for each agent."""
         components = {}
+        # the factory only holds references to shared objects, so one serves every agent. Clocks
+        # stay per agent since each phone scene shifts its own clock into a higher gear
+        mem_fact = blank_memories.MemoryFactory(
+            model=self.model,
+            embedder=self.embedder,
+            importance=self.importance_model.importance,
+            clock_now=self.clock.now,
+        )
         for agent_name, agent in self.agents.items():
             if self.roles[agent_name] != "exogenous":
                 memory_p = associative_memory.AssociativeMemory(
                     self.embedder, self.importance_model_gm.importance, clock=self.clock.now
                 )
-                mem_fact = blank_memories.MemoryFactory(
-                    model=self.model,
-                    embedder=self.embedder,
-                    importance=self.importance_model.importance,
-                    clock_now=self.clock.now,
-                )
                 curr_clock = game_clock.MultiIntervalClock(
                     self.clock.now(),
                     step_sizes=[datetime.timedelta(seconds=1800), datetime.timedelta(seconds=10)],
@@ -85,7 +94,12 @@ class GameMaster:
         return components
 
     def _step_agent(self, agent):
-        """Run a single agent's action and trigger their phone scene."""
+        """Run a single agent's action and trigger their phone scene.
+
+        Returns the step's result message and the agent's episode plan log entry (None if
+        the agent failed before acting), which `step` adds to the log once it is collected.
+        """
+        log_entry = None
         try:
             if self.roles[agent._agent_name] == "exogenous":
                 action = agent.post(self.phones[agent._agent_name].apps[0])
@@ -93,20 +107,31 @@ class GameMaster:
                 self.model.meta_data["agent_name"] = agent._agent_name
                 action = agent.act(self.action_spec)
             event_statement = f"{agent._agent_name} acted: {action}"  # the
-            print(event_statement)
-            # 2. Log the action (ensure this is thread-safe)
-            self.log_data.append(
-                {"source_user": agent._agent_name, "label": "episode_plan", "data": action}
-            )
+            # 2. Record the action for the log
+            log_entry = {"source_user": agent._agent_name, "label": "episode_plan", "data": action}
 
             # 3. Trigger the phone scene for this agent using their unique component
             if self.roles[agent._agent_name] != "exogenous":
                 self.agent_components[agent._agent_name].update_after_event(event_statement)
 
-            return event_statement
+            return event_statement, log_entry
         except Exception as e:
             # Handle any agent-specific exceptions
-            return f"Error for {agent._agent_name}: {e!s}"
+            return f"Error for {agent._agent_name}: {e!s}", log_entry
+
+    def _collect(self, finished, label="Result"):
+        """Report the results of finished step futures and add their plans to the log."""
+        results = []
+        for future, agent_name in finished.items():
+            try:
+                result, log_entry = future.result()
+            except Exception as e:
+                results.append(f"Error in thread for {agent_name}: {e!s}")
+                continue
+            results.append(f"{label} for {agent_name}: {result}")
+            if log_entry is not None:
+                self.log_data.append(log_entry)
+        return results
 
     def step(self, active_agents=None, timeout=300):
         """
@@ -114,36 +139,46 @@ class GameMaster:
 
         Args:
             active_agents: List of agent names to take part in the step. If None, all agents act.
-            timeout: Timeout in seconds for each agent's action.
+            timeout: Seconds the step waits for its agents. Agents can't be interrupted
+                mid-act, so those still acting at the deadline are left to finish in the
+                background: the step advances without their results, which are reported
+                by the first step after they finish, and they sit out steps until then.
         """
         if active_agents is None:
             active_agents = list(self.agents.keys())
 
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                executor.submit(self._step_agent, self.agents[agent_name]): agent_name
-                for agent_name in active_agents
-            }
-
-            try:
-                # Apply an overall timeout for `as_completed`
-                for future in as_completed(futures, timeout=timeout * len(active_agents)):
-                    agent_name = futures[future]
-                    try:
-                        # Still applying timeout for each future result individually
-                        result = future.result(timeout=timeout * 2)
-                        print(f"Result for {agent_name}: {result}")
-                    except TimeoutError:
-                        print(f"Timeout for {agent_name}. Skipping their turn.")
-                    except Exception as e:
-                        print(f"Error in thread for {agent_name}: {e!s}")
-            except TimeoutError:
-                # This handles the overall timeout for the entire `as_completed` call
-                print("Overall step timed out before all agents could complete.")
-
-        # Advance the game clock after all agents' actions are complete
+        finished_late = {future: name for name, future in self._late.items() if future.done()}
+        for agent_name in finished_late.values():
+            del self._late[agent_name]
+        skipped = [agent_name for agent_name in active_agents if agent_name in self._late]
+        if skipped:
+            print(f"Still acting from an earlier step, skipped: {', '.join(skipped)}")
+
+        futures = {
+            self._executor.submit(self._step_agent, self.agents[agent_name]): agent_name
+            for agent_name in active_agents
+            if agent_name not in self._late
+        }
+        done, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            late = [futures[future] for future in not_done]
+            print(f"Step deadline of {timeout}s passed, advancing without: {', '.join(late)}")
+            self._late |= {futures[future]: future for future in not_done}
+
+        # results are reported from this thread rather than by workers contending on stdout
+        results = self._collect(finished_late, label="Late result") + self._collect(
+            {future: agent_name for future, agent_name in futures.items() if future in done}
+        )
+        if results:
+            print("\n".join(results))
+
+        # Advance the game clock once the step's deadline is met or all its agents are done
         self.clock.advance()
 
+    def close(self):
+        """Shut down the worker pool once the game is over, waiting for any late agents."""
+        self._executor.shutdown(wait=True)
+
     def run_game(self, steps=10):
         """Run the game for a given number of steps."""
         for _ in range(steps):
@@ -1,12 +1,14 @@
-import ast
 import datetime
+import functools
+import io
+import itertools
 import json
 import random
 import re
 from collections.abc import Callable, Sequence
 from decimal import ROUND_HALF_UP, Decimal
 from inspect import signature
-from typing import Any
+from typing import Any, TextIO
 
 import numpy as np
 from concordia.agents import entity_agent_with_logging
@@ -46,6 +48,37 @@ DEFAULT_ACTION_PROBABILITIES = {
 }
 NUM_MEMORIES = 10
 RECENT_MEMORY_WINDOW_IN_HOURS = 4
+# output budget of free-text actions by ActionSpec tag. Probe answers ("query") are a few
+# words, so a tight cap keeps a rambling completion from holding up the whole probe round
+FREE_ACTION_MAX_TOKENS = {"query": 100}
+DEFAULT_FREE_ACTION_MAX_TOKENS = 2200
+# first number in a FLOAT action's answer that float() can't read whole, so
+# "0.42 (because ...)" still reads as 0.42
+_FLOAT_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+@functools.lru_cache(maxsize=256)
+def _component_takes_model(component_constructor) -> bool:
+    """Whether a component class, or its direct base, takes a `model` argument.
+
+    Cached per class, since every agent build inspects the same few component classes.
+    """
+    return any(
+        "model" in signature(constructor.__init__).parameters
+        for constructor in (component_constructor, component_constructor.__bases__[0])
+    )
+
+
+def make_component(component_constructor, model, settings):
+    """Instantiate a component from its settings, adding `model` if the component takes one."""
+    if _component_takes_model(component_constructor):
+        settings["model"] = model
+    return component_constructor(**settings)
+
+
+@functools.lru_cache(maxsize=16)
+def _readable_step_size(step_size: datetime.timedelta) -> str:
+    return helper_functions.timedelta_to_readable_str(step_size)
 
 
 class AllActComponent(entity_component.ActingComponent):
@@ -63,8 +96,9 @@ class AllActComponent(entity_component.ActingComponent):
             self._component_order = None
         else:
             self._component_order = tuple(component_order)
+            self._component_order_set = frozenset(self._component_order)
         if self._component_order is not None:
-            if len(set(self._component_order)) != len(self._component_order):
+            if len(self._component_order_set) != len(self._component_order):
                 raise ValueError(
                     "The component order contains duplicate components: "
                     + ", ".join(self._component_order)
@@ -72,6 +106,9 @@ class AllActComponent(entity_component.ActingComponent):
 
         self._pre_act_key = pre_act_key
         self._logging_channel = logging_channel
+        # reused across actions: the agent's control lock serializes them, and each action's
+        # prompt is logged before the next one clears it
+        self._prompt = interactive_document.InteractiveDocument(model)
 
     def _context_for_action(
         self,
@@ -79,10 +116,15 @@ class AllActComponent(entity_component.ActingComponent):
     ) -> str:
         if self._component_order is None:
             return "\n".join(context for context in contexts.values() if context)
-        order = self._component_order + tuple(
-            sorted(set(contexts.keys()) - set(self._component_order))
+        extras = sorted(name for name in contexts if name not in self._component_order_set)
+        # join a list, not a generator: str.join materializes a generator into a list first
+        return "\n\n".join(
+            [
+                context
+                for name in itertools.chain(self._component_order, extras)
+                if (context := contexts.get(name))
+            ]
         )
-        return "\n\n".join(contexts[name] for name in order if contexts.get(name, False))
         # return "\n".join(contexts[name] for name in order if contexts[name])
 
     def get_action_attempt(
@@ -90,13 +132,14 @@ class AllActComponent(entity_component.ActingComponent):
         contexts: entity_component.ComponentContextMapping,
         action_spec: entity_lib.ActionSpec,
     ) -> str:
-        prompt = interactive_document.InteractiveDocument(self._model)
+        prompt = self._prompt
+        prompt.clear()
         context = self._context_for_action(contexts)
         prompt.statement(context + "\n")
 
         call_to_action = action_spec.call_to_action.format(
             name=self.get_entity().name,
-            timedelta=helper_functions.timedelta_to_readable_str(self._clock.get_step_size()),
+            timedelta=_readable_step_size(self._clock.get_step_size()),
         )
 
         if action_spec.output_type == entity_lib.OutputType.FREE:
@@ -140,7 +183,9 @@ class AllActComponent(entity_component.ActingComponent):
                     output = self.get_entity().name + " "
                     output += prompt.open_question(
                         call_to_action,
-                        max_tokens=2200,
+                        max_tokens=FREE_ACTION_MAX_TOKENS.get(
+                            action_spec.tag, DEFAULT_FREE_ACTION_MAX_TOKENS
+                        ),
                         answer_prefix=output,
                         # This terminator protects against the model providing extra context
                         # after the end of a directly spoken response, since it normally
@@ -149,9 +194,10 @@ class AllActComponent(entity_component.ActingComponent):
                         question_label="Exercise",
                     )
             else:
+                # the phone scene prefixes the call to action with a JSON list of media urls
                 media_str, call_to_action = call_to_action.split("Context", 1)
                 call_to_action = "Context" + call_to_action
-                media_list = ast.literal_eval(media_str.strip())
+                media_list = json.loads(media_str)
                 output = self.get_entity().name + " "
                 output += self._model.sample_text(
                     prompt=context + "\n" + call_to_action,  # order correct?
@@ -177,7 +223,8 @@ class AllActComponent(entity_component.ActingComponent):
             try:
                 return str(float(sampled_text))
             except ValueError:
-                return "0.0"
+                match = _FLOAT_RE.search(sampled_text)
+                return str(float(match.group())) if match else "0.0"
         else:
             raise NotImplementedError(
                 f"Unsupported output type: {action_spec.output_type}. "
@@ -371,6 +418,7 @@ class BaseAgentBuilder(ABC):
         clock: game_clock.MultiIntervalClock,
         update_time_interval: datetime.timedelta | None = None,
         input_data: dict[str, Any] = {},
+        measurements: measurements_lib.Measurements | None = None,
     ) -> entity_agent_with_logging.EntityAgentWithLogging:
         """Build an agent.
 
@@ -380,6 +428,7 @@ class BaseAgentBuilder(ABC):
             memory: The agent's memory object.
             clock: The clock to use.
             update_time_interval: Unused (but required by the interface for now)
+            measurements: Registry the agent's components log to. A new one is made if None.
             role_and_setting_config:
                 -name
                 -agent_name
@@ -397,7 +446,8 @@ class BaseAgentBuilder(ABC):
         goal = config.goal
 
         raw_memory = legacy_associative_memory.AssociativeMemoryBank(memory)
-        measurements = measurements_lib.Measurements()
+        if measurements is None:
+            measurements = measurements_lib.Measurements()
 
         # labels of base components and common settings
         names = [
@@ -405,7 +455,8 @@ class BaseAgentBuilder(ABC):
                 "Instructions",
                 "ROLE-PLAYING INSTRUCTIONS\n",
             ],  # cls._get_component_name()=Instructions
-            ["OverarchingGoal", "OVERARCHING GOAL"],  # cls._get_component_name()=Constant
+            # agents without a goal get no (empty) goal component
+            *([["OverarchingGoal", "OVERARCHING GOAL"]] if goal else []),  # Constant
             ["Observation", "OBSERVATIONS\n"],  # cls._get_component_name()=Observation
             [
                 "ObservationSummary",
@@ -489,13 +540,9 @@ class BaseAgentBuilder(ABC):
             # check for and add dependencies
             if name in dependencies:
                 settings["components"] = dependencies[name]
-            if "model" in signature(component_constructor.__init__).parameters.keys():
-                settings["model"] = model
-            if "model" in signature(component_constructor.__bases__[0].__init__).parameters.keys():
-                settings["model"] = model
 
             # instantiate
-            z[name] = component_constructor(**settings)
+            z[name] = make_component(component_constructor, model, settings)
 
         # add custom components
         # n.b. custom components can be interleaved so reassign order
@@ -530,7 +577,8 @@ class BaseAgentBuilder(ABC):
 
 def save_agent_to_json(
     agent: entity_agent_with_logging.EntityAgentWithLogging,
-) -> str:
+    fp: TextIO | None = None,
+) -> str | None:
     """Saves an agent to JSON data.
 
     This function saves the agent's state to a JSON string, which can be loaded
@@ -542,10 +590,12 @@ def save_agent_to_json(
 
     Args:
         agent: The agent to save.
+        fp: Optional text file to stream the JSON to. Component states are then
+            written one at a time instead of being collected into one dict first.
 
     Returns
     -------
-        A JSON string representing the agent's state.
+        A JSON string representing the agent's state, or None if `fp` was given.
 
     Raises
     ------
@@ -554,18 +604,26 @@ def save_agent_to_json(
     if agent.get_phase() != entity_component.Phase.READY:
         raise ValueError("The agent must be in the `READY` phase to be saved.")
 
-    data = {
-        component_name: agent.get_component(component_name).get_state()
-        for component_name in agent.get_all_context_components()
-    }
+    if fp is None:
+        buffer = io.StringIO()
+        save_agent_to_json(agent, buffer)
+        return buffer.getvalue()
 
-    data["act_component"] = agent.get_act_component().get_state()
+    fp.write("{")
+    for component_name in agent.get_all_context_components():
+        fp.write(json.dumps(component_name) + ": ")
+        json.dump(agent.get_component(component_name).get_state(), fp)
+        fp.write(", ")
+
+    fp.write('"act_component": ')
+    json.dump(agent.get_act_component().get_state(), fp)
 
     config = agent.get_config()
     if config is not None:
-        data["agent_config"] = config.to_dict()
-
-    return json.dumps(data)
+        fp.write(', "agent_config": ')
+        json.dump(config.to_dict(), fp)
+    fp.write("}")
+    return None
 
 
 def rebuild_from_json(
@@ -1,4 +1,5 @@
 import json
+from typing import TextIO
 
 
 class AgentModel:
@@ -62,15 +63,17 @@ class AgentBuilder:
 
 def save_agent_to_json(
     agent: AgentModel,
-) -> str:
-    """
-    Saves an agent to JSON data.
-    """
+    fp: TextIO | None = None,
+) -> str | None:
+    """Save an agent to JSON data, streaming it to `fp` if given."""
     data = {}
     data["current_post_index"] = agent.current_post_index
-    data["used_posts"] = agent.used_posts
+    data["used_posts"] = list(agent.used_posts)
     data["name"] = agent._agent_name
     data["posts"] = agent.posts
+    if fp is not None:
+        json.dump(data, fp)
+        return None
     return json.dumps(data)
 
 
@@ -85,5 +88,5 @@ def rebuild_from_json(
         posts=data["posts"],
     )
     agent.current_post_index = data["current_post_index"]
-    agent.used_posts = data["used_posts"]
+    agent.used_posts = set(data["used_posts"])
     return agent
@@ -1,3 +1,5 @@
+import json
+
 import networkx as nx
 import pandas as pd
 
@@ -5,7 +7,8 @@ import pandas as pd
 def load_data(fileroot):
     with open(fileroot + ".json") as file:
         config_data = json.load(file)
-    df = pd.read_json(fileroot + "_output.jsonl", lines=True)
+    # nested event payloads stay as dicts; skip dtype inference on the object columns
+    df = pd.read_json(fileroot + "_output.jsonl", lines=True, dtype=False)
     pd.set_option("display.width", 1000)
     print(df.head())
     print()
@@ -23,13 +26,13 @@ def post_process_output(df):
     probe_df = df.loc[
         df.event_type == "probe", ["episode", "source_user", "label", "data"]
     ].reset_index(drop=True)
-    probe_df["response"] = probe_df.data.apply(lambda x: x["query_return"])
+    probe_df["response"] = probe_df.data.str.get("query_return")
     probe_df = probe_df.drop("data", axis=1)
 
     edge_df = df.loc[
         df.label.isin(["follow", "unfollow"]), ["episode", "source_user", "data", "label"]
     ].reset_index(drop=True)
-    edge_df["target_user"] = edge_df.data.apply(lambda d: d["target_user"])
+    edge_df["target_user"] = edge_df.data.str.get("target_user")
     edge_df = edge_df.drop("data", axis=1)
 
     interaction_types = ["post", "like_toot", "boost_toot", "reply"]
@@ -22,6 +22,9 @@ def generate_sim_config(example_name):
     default_sim_config["sentence_encoder"] = (
         "sentence-transformers/all-mpnet-base-v2"  # select sentence embedding model
     )
+    default_sim_config["embedding_cache_path"] = (
+        None  # .npz file of embeddings reused across runs (one per sentence encoder)
+    )
     default_sim_config["model"] = "gpt-4o-mini"  # select language model to run sim
     default_sim_config["persona_type"] = "Reddit.Big5"  # persona
     default_sim_config["run_name"] = "run1"  # experiment label
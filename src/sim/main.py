@@ -27,31 +27,36 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 print("project root: " + str(PROJECT_ROOT))
 os.chdir(PROJECT_ROOT)
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
+# agent and setting modules import `agent_utils` and `sim_utils` as top-level packages, so they
+# are imported that way here too and each module (and its module-level state) is loaded once
+sys.path.insert(0, str(PROJECT_ROOT / "src" / "sim"))
 
-# mastodon_sim functions
-from mastodon_sim.mastodon_ops import check_env, clear_mastodon_server
-from sim.sim_utils.agent_speech_utils import (
+# sim functions
+from sim_utils.agent_speech_utils import (
+    build_probe_queries,
     deploy_probes,
     write_seed_toot,
 )
-from sim.sim_utils.concordia_utils import (
+from sim_utils.concordia_utils import (
     build_agent_with_memories,
     generate_concordia_memory_objects,
     make_profiles,
     set_up_mastodon_app_usage,
 )
-
-# sim functions
-from sim.sim_utils.media_utils import select_large_language_model
-from sim.sim_utils.misc_sim_utils import (
+from sim_utils.media_utils import select_large_language_model
+from sim_utils.misc_sim_utils import (
     ConfigStore,
     EventLogger,
     StdoutToLogger,
+    flush_event_logs,
     get_sentance_encoder,
     post_analysis,
     rebuild_from_saved_checkpoint,
 )
 
+# mastodon_sim functions
+from mastodon_sim.mastodon_ops import check_env, clear_mastodon_server
+
 
 def post_seed_toots(agents, mastodon_apps):
     # Parallelize the loop using ThreadPoolExecutor
@@ -77,6 +82,30 @@ def post_seed_toots(agents, mastodon_apps):
             future.result()  # This will raise any exceptions that occurred in the thread, if any
 
 
+def save_agent_checkpoints(agent_data, agents, output_rootname, episode_idx):
+    for agent_input, agent in zip(agent_data, agents, strict=False):
+        agent_dir = os.path.join(output_rootname + "agent_checkpoints", agent._agent_name)
+        os.makedirs(agent_dir, exist_ok=True)
+        file_path = os.path.join(agent_dir, f"Episode_{episode_idx}.json")
+        module_path = (
+            "sim_setting." + agent_input["role_dict"]["module_path"]
+            if agent_input["role_dict"]["name"] != "exogeneous"
+            else "agent_utils.exogenous_agent"
+        )
+        with open(file_path, "w") as file:
+            importlib.import_module(module_path).save_agent_to_json(agent, file)
+
+
+def close_run(env, agent_measurements, embedder):
+    # release what the run holds (agent workers, component logging registries) and write out
+    # what it buffered (embedding cache, queued event records)
+    env.close()
+    for measurements in agent_measurements.values():
+        measurements.close()
+    embedder.save()
+    flush_event_logs()
+
+
 def run_sim(
     model,
     embedder,
@@ -104,7 +133,7 @@ def run_sim(
 
     # build agent models
     agent_data = agent_settings["directory"]
-    get_idx = lambda name: [ait for ait, agent in enumerate(agent_data) if agent["name"] == name][0]
+    agent_data_by_name = {agent_info["name"]: agent_info for agent_info in agent_data}
 
     profiles, roles = make_profiles(agent_data)  # profile format: (agent_config,role)
     role_parameters = setting_info["details"]["role_parameters"]
@@ -133,7 +162,16 @@ def run_sim(
     # build agents
     agents = []
     local_post_analyze_data = {}
-    obj_args = (formative_memory_factory, model, clock, time_step, setting_info)
+    # per-agent component logging registries, scoped to this run
+    agent_measurements = {}
+    obj_args = (
+        formative_memory_factory,
+        model,
+        clock,
+        time_step,
+        setting_info,
+        agent_measurements,
+    )
     build_agent_with_memories_part = partial(build_agent_with_memories, obj_args)
     with concurrent.futures.ThreadPoolExecutor(max_workers=len(profiles)) as pool:
         for agent_obj in pool.map(build_agent_with_memories_part, profiles.values()):
@@ -144,7 +182,7 @@ def run_sim(
     for agent in agents:
         if roles[agent._agent_name] == "exogenous":
             # assign seed toots of exogenous agents with absolute path to images (if non empty)
-            agent.seed_toot = agent_data[get_idx(agent._agent_name)]["seed_toot"]
+            agent.seed_toot = agent_data_by_name[agent._agent_name]["seed_toot"]
             for post_text in agent.posts:
                 agent.posts[post_text] = [
                     str(PROJECT_ROOT) + "/" + path for path in agent.posts[post_text]
@@ -181,6 +219,7 @@ def run_sim(
 
     # initialize
     probe_event_logger = EventLogger("probe", cfg.sim.output_rootname + "_events.jsonl")
+    probe_queries = build_probe_queries(probes)
 
     if load_from_checkpoint_path:
         (agents, clock) = rebuild_from_saved_checkpoint(
@@ -201,7 +240,7 @@ def run_sim(
         print(f"Episode: {i}. Deploying survey...", end="")
         deploy_probes(
             [agent for agent in agents if roles[agent._agent_name] != "exogenous"],
-            probes,
+            probe_queries,
             probe_event_logger,
         )
         print("complete")
@@ -226,21 +265,9 @@ def run_sim(
 
         # save chaeckpoints
         if save_checkpoints:
-            for agent_input, agent in zip(agent_data, agents, strict=False):
-                agent_dir = os.path.join(
-                    cfg.sim.output_rootname + "agent_checkpoints", agent._agent_name
-                )
-                os.makedirs(agent_dir, exist_ok=True)
-                file_path = os.path.join(agent_dir, f"Episode_{i}.json")
-                module_path = (
-                    "sim_setting." + agent_input["role_dict"]["module_path"]
-                    if agent_input["role_dict"]["name"] != "exogeneous"
-                    else "agent_utils.exogenous_agent"
-                )
-                json_data = importlib.import_module(module_path).save_agent_to_json(agent)
-                with open(file_path, "w") as file:
-                    file.write(json.dumps(json_data, indent=4))
+            save_agent_checkpoints(agent_data, agents, cfg.sim.output_rootname, i)
 
+    close_run(env, agent_measurements, embedder)
     if output_post_analysis:
         post_analysis(env, model, agents, roles, local_post_analyze_data, cfg.sim.output_rootname)
 
@@ -286,7 +313,7 @@ def main(cfg: DictConfig):
     model = select_large_language_model(
         cfg.sim.model, cfg.sim.output_rootname + "_prompts_and_responses.jsonl", True
     )
-    embedder = get_sentance_encoder(cfg.sim.sentence_encoder)
+    embedder = get_sentance_encoder(cfg.sim.sentence_encoder, cfg.sim.embedding_cache_path)
 
     # set gamemaster settings
     gamemaster_settings = {
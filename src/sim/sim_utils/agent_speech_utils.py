@@ -1,6 +1,7 @@
 import importlib
+import re
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from concordia.typing import entity
 
@@ -11,31 +12,47 @@ DEFAULT_CALL_TO_SPEECH = (
     'Ichabod -- "I wonder if the alfalfa is ready to harvest", or '
     'Townsfolk -- "Good morning".\n'
 )
+SEED_TOOT_INSTRUCTION = (
+    "Thought on Mastodon Toot: In less than 100 words, write a toot that aligns with your views"
+    " and background."
+)
+
+# probe workers only wait on the model, so concurrency is bounded by what the model endpoint
+# serves rather than by the executor's CPU-count default
+MAX_PROBE_WORKERS = 64
+
+# templates are pre-split on their name placeholder so filling them in is a single join
+_CALL_TO_SPEECH_PARTS = DEFAULT_CALL_TO_SPEECH.split("{name}")
+# `{name} -- "..."` speech, as requested by DEFAULT_CALL_TO_SPEECH
+_SPEECH_RE = re.compile(r'\s*(?P<speaker>[^"\n]*?)\s*--\s*"?(?P<body>.*?)"?\s*$', re.DOTALL)
+
+
+def call_to_speech(name):
+    """Return the call to speech asking `name` to reply as `{name} -- "..."`."""
+    return name.join(_CALL_TO_SPEECH_PARTS)
+
+
+def speech_body(name, agent_says):
+    """Return what `name` said, without the `{name} -- "..."` framing of the call to speech."""
+    match = _SPEECH_RE.match(agent_says)
+    if match and match.group("speaker") == name:
+        return match.group("body")
+    # acting components always prefix the answer with the speaker's name
+    return agent_says.removeprefix(name).strip().strip('"')
 
 
 def write_seed_toot(agent):
-    call_to_speech = DEFAULT_CALL_TO_SPEECH.format(
-        name=agent._agent_name,
-    )
-    interaction_premise = f"{agent._agent_name} has to make their first toot on Mastodon\n"
-    interrogation = interaction_premise
-    interrogation += "Thought on Mastodon Toot: In less than 100 words, write a toot that aligns with your views and background."
+    name = agent._agent_name
     agent_says = agent.act(
         action_spec=entity.ActionSpec(
-            call_to_action="Context: " + interrogation + call_to_speech,
+            call_to_action=(
+                f"Context: {name} has to make their first toot on Mastodon\n"
+                f"{SEED_TOOT_INSTRUCTION}{call_to_speech(name)}"
+            ),
             output_type=entity.OutputType.FREE,
         ),
     )
-    agent_says = (
-        agent_says.strip(agent._agent_name.split()[0])
-        .strip()
-        .strip(agent._agent_name.split()[1])
-        .strip()
-        .strip("--")
-        .strip()
-        .strip('"')
-    )
-    return agent_says
+    return speech_body(name, agent_says)
 
 
 class AgentQuery(ABC):
@@ -55,12 +72,12 @@ class AgentQuery(ABC):
                 self.question_template += component["text"].format(**query_data[component_name])
             else:
                 self.question_template += component["text"]
+        self._question_parts = self.question_template.split("{agentname}")
         self.query_data = query_data
 
     def form_query_for_agent(self, agent):
-        call_to_speech = DEFAULT_CALL_TO_SPEECH.format(name=agent._agent_name)
-        question = self.question_template.format(agentname=agent._agent_name)
-        return "Context: " + question + call_to_speech
+        name = agent._agent_name
+        return f"Context: {name.join(self._question_parts)}{call_to_speech(name)}"
 
     def ask(self, agent):
         agent_question = self.form_query_for_agent(agent)
@@ -78,13 +95,17 @@ class AgentQuery(ABC):
     def submit(self, agent):
         agent_says = self.ask(agent)
         query_return = self.query_data.copy()
-        query_return["query_return"] = self.parse_answer(agent_says)
+        # parse only the answer, so the speaker's own name can't be read as part of it
+        answer = speech_body(agent._agent_name, agent_says)
+        query_return["query_return"] = self.parse_answer(answer)
         return query_return
 
 
-def deploy_probes_to_agent(agent, queries, probe_event_logger):
+def deploy_probes_to_agent(agent, queries):
+    # queries to one agent stay sequential: agent.act holds the agent's control lock, so
+    # a nested pool would only queue on it. Parallelism is across agents (deploy_probes).
     agent_query_returns = [query.submit(agent) for query in queries]
-    agent_results = [
+    return [
         {
             "source_user": agent._agent_name,
             "label": agent_query_return["query_type"],
@@ -92,10 +113,9 @@ def deploy_probes_to_agent(agent, queries, probe_event_logger):
         }
         for agent_query_return in agent_query_returns
     ]
-    probe_event_logger.log(agent_results)
 
 
-def deploy_probes(agents, probes, probe_event_logger):
+def build_probe_queries(probes):
     query_lib_module = "sim_setting." + probes["query_lib_module"]
     queries_data = probes["queries_data"].values()
     queries = []
@@ -104,10 +124,19 @@ def deploy_probes(agents, probes, probe_event_logger):
             importlib.import_module(query_lib_module), query_data["query_type"]
         )  # "module.submodule"
         queries.append(QueryClass(query_data))
+    return queries
+
 
-    with ThreadPoolExecutor() as executor:
-        # Parallel probing
+def deploy_probes(agents, queries, probe_event_logger):
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_PROBE_WORKERS, len(agents)))) as executor:
+        # Parallel probing. Results are logged from this thread as agents finish, so the
+        # pool's workers only ever wait on the model
         query_returns_over_agents = {
-            executor.submit(deploy_probes_to_agent, agent, queries, probe_event_logger): agent
-            for agent in agents
+            executor.submit(deploy_probes_to_agent, agent, queries): agent for agent in agents
         }
+        for future in as_completed(query_returns_over_agents):
+            try:
+                probe_event_logger.log(future.result())
+            except Exception as e:
+                agent = query_returns_over_agents[future]
+                print(f"Probing {agent._agent_name} failed: {e}")
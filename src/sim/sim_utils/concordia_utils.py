@@ -2,12 +2,14 @@ import concurrent.futures
 import importlib
 import random
 
+import numpy as np
 from concordia.associative_memory import (
     associative_memory,
     blank_memories,
     formative_memories,
     importance_function,
 )
+from concordia.utils import measurements as measurements_lib
 
 from mastodon_sim.concordia import apps
 from mastodon_sim.mastodon_ops import update_bio
@@ -74,7 +76,14 @@ def make_profiles(agent_data):
 def build_agent_with_memories(obj_args, profile_item):
     profile_cfg = profile_item["cfg"]
     role_dict = profile_item["role_dict"]
-    (formative_memory_factory, model, clock, time_step, setting_info) = obj_args
+    (
+        formative_memory_factory,
+        model,
+        clock,
+        time_step,
+        setting_info,
+        agent_measurements,
+    ) = obj_args
 
     # for non-exogenous agents
     if role_dict["name"] == "exogenous":
@@ -88,6 +97,9 @@ def build_agent_with_memories(obj_args, profile_item):
         }
         module_path = "sim_setting." + role_dict["module_path"]
         mem = formative_memory_factory.make_memories(profile_cfg)
+        # component logs go to a registry owned by the run, so they are dropped with it
+        measurements = measurements_lib.Measurements()
+        agent_measurements[role_dict["agent_name"]] = measurements
         input_args = {
             "config": profile_cfg,
             "input_data": role_dict | setting_data,
@@ -95,6 +107,7 @@ def build_agent_with_memories(obj_args, profile_item):
             "clock": clock,
             "update_time_interval": time_step,
             "memory": mem,
+            "measurements": measurements,
         }
         store_for_local_post_analysis = mem
 
@@ -121,22 +134,22 @@ def set_up_mastodon_app_usage(roles, role_parameters, action_logger, app_descrip
         mastodon_apps[p].set_user_mapping(user_mapping)
 
     # initiailize initial social network. Pre-generate unique follow relationships
-    follow_pairs = set()
-    # Now, generate additional follow relationships between agents.
+    # with one-direction follows drawn according to the stored role-to-role probability,
+    # sampled for all agent pairs at once (seeded from the sim-wide `random` state)
     role_prob_matrix = role_parameters["initial_follow_prob"]
-    agent_roles = []
-    for agent_i, role_i in roles.items():
-        for agent_j, role_j in roles.items():
-            prob = role_prob_matrix[role_i][role_j]
-            if False:
-                if follower != followee:
-                    # With a 20% chance, create mutual follow relationships.
-                    if random.random() < 0.2:
-                        follow_pairs.add((follower, followee))
-                        follow_pairs.add((followee, follower))
-            # Otherwise, with a create a one-direction follow according to stored probability.
-            if random.random() < prob:
-                follow_pairs.add((agent_i, agent_j))
+    agent_names = list(roles)
+    role_names = list(role_prob_matrix)
+    role_idx = np.array([role_names.index(role) for role in roles.values()])
+    role_probs = np.array(
+        [[role_prob_matrix[role_i][role_j] for role_j in role_names] for role_i in role_names]
+    )
+    follow_probs = role_probs[np.ix_(role_idx, role_idx)]
+    rng = np.random.default_rng(random.getrandbits(64))
+    follower_idx, followee_idx = np.nonzero(rng.random(follow_probs.shape) < follow_probs)
+    follow_pairs = {
+        (agent_names[i], agent_names[j])
+        for i, j in zip(follower_idx.tolist(), followee_idx.tolist(), strict=True)
+    }
 
     # Execute the follow operations concurrently.
     with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -1,5 +1,7 @@
 import json
 import os
+import random
+import time
 from collections.abc import Collection, Sequence
 
 import openai
@@ -9,6 +11,27 @@ from concordia.utils import measurements as measurements_lib
 from concordia.utils import sampling
 
 _MAX_MULTIPLE_CHOICE_ATTEMPTS = 20
+_MAX_API_ATTEMPTS = 8
+_MAX_BACKOFF_SECONDS = 60
+
+
+def _with_retries(call):
+    """Return `call()`, retrying transient OpenAI API errors with exponential backoff.
+
+    Any other API error is raised at once, and so is any error on the last attempt.
+    """
+    for attempt in range(_MAX_API_ATTEMPTS - 1):
+        try:
+            return call()
+        except openai.RateLimitError as e:
+            print(f"OpenAI API request exceeded rate limit: {e}")
+        except openai.APIConnectionError as e:
+            print(f"Failed to connect to OpenAI API: {e}")
+        except openai.InternalServerError as e:
+            print(f"OpenAI API returned a server error: {e}")
+        # exponential backoff with jitter, so concurrent agents don't retry in lockstep
+        time.sleep(min(_MAX_BACKOFF_SECONDS, 2**attempt) * random.uniform(0.5, 1.0))
+    return call()
 
 
 class GptLanguageModel(language_model.LanguageModel):
@@ -109,28 +132,16 @@ class GptLanguageModel(language_model.LanguageModel):
             messages.append({"role": "user", "content": prompt})
             stop_param = terminators
 
-        has_result = False
-        while not has_result:
-            try:
-                response = self._client.chat.completions.create(  # type: ignore
-                    model=self._model_name,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    timeout=timeout,
-                    **({"stop": stop_param} if stop_param is not None else {}),
-                )
-                has_result = True
-            except openai.APIError as e:
-                # Handle API error here, e.g. retry or log
-                print(f"OpenAI API returned an API Error: {e}")
-                print(prompt)
-            except openai.APIConnectionError as e:
-                # Handle connection error here
-                print(f"Failed to connect to OpenAI API: {e}")
-            except openai.RateLimitError as e:
-                # Handle rate limit error (we recommend using exponential backoff)
-                print(f"OpenAI API request exceeded rate limit: {e}")
+        response = _with_retries(
+            lambda: self._client.chat.completions.create(  # type: ignore
+                model=self._model_name,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                **({"stop": stop_param} if stop_param is not None else {}),
+            )
+        )
 
         if self._measurements is not None:
             answer = response.choices[0].message.content
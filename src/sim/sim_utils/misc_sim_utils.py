@@ -1,17 +1,15 @@
+import atexit
+import collections
+import concurrent.futures
+import datetime
 import json
 import logging
+import os
+import queue
 import threading
-from typing import cast
-
-from concordia.utils import html as html_lib
-from hydra.core.hydra_config import HydraConfig
-from IPython import display
-from omegaconf import DictConfig
-
-file_lock = threading.Lock()
-import datetime
 import warnings
 from collections.abc import Callable
+from typing import cast
 
 import numpy as np
 from concordia.associative_memory import (
@@ -20,6 +18,10 @@ from concordia.associative_memory import (
 )
 from concordia.clocks import game_clock
 from concordia.language_model import language_model
+from concordia.utils import html as html_lib
+from hydra.core.hydra_config import HydraConfig
+from IPython import display
+from omegaconf import DictConfig
 
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore")
@@ -41,20 +43,186 @@ class StdoutToLogger:
         pass
 
 
-def get_sentance_encoder(model_name):
+def get_sentance_encoder(model_name, cache_path=None):
     # Setup sentence encoder
     st_model = sentence_transformers.SentenceTransformer(model_name)
-    embedder = lambda x: st_model.encode(x, show_progress_bar=False)
+    embedder = CachedEmbedder(
+        BatchingEmbedder(lambda texts: st_model.encode(texts, show_progress_bar=False)),
+        path=cache_path,
+        encoder_name=model_name,
+    )
     return embedder
 
 
+class CachedEmbedder:
+    """LRU cache of sentence embeddings, keyed by text.
+
+    Shared memories, setting descriptions and candidate information are added to every
+    agent's memory, so most texts are embedded many times over; repeats are served from
+    the cache instead of the model. Given a `path`, the cache is loaded from it if it
+    exists and `save` writes it back, so repeated runs skip re-embedding their shared
+    texts. The file records `encoder_name`, and a file written by another sentence
+    encoder is not loaded.
+    """
+
+    def __init__(self, embedder, maxsize=50_000, path=None, encoder_name=""):
+        self._embedder = embedder
+        self._maxsize = maxsize
+        self._path = path
+        self._encoder_name = encoder_name
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __call__(self, text):
+        """Return the embedding of `text`, encoding it only if it isn't cached."""
+        with self._lock:
+            embedding = self._cache.get(text)
+            if embedding is not None:
+                self._cache.move_to_end(text)
+                return embedding
+        embedding = self._embedder(text)
+        with self._lock:
+            self._cache[text] = embedding
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return embedding
+
+    def save(self, path=None):
+        """Write the cached embeddings, with the encoder's name, to an .npz file.
+
+        Parameters
+        ----------
+        path : str, optional
+            File to write. Defaults to the cache's own `path`. If neither is set, or the
+            cache is empty, nothing is written.
+        """
+        path = path or self._path
+        if path is None:
+            return
+        with self._lock:
+            texts = list(self._cache)
+            embeddings = list(self._cache.values())
+        if not texts:
+            return
+        # written through a file object so np.savez keeps the given path as is
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                encoder_name=np.array(self._encoder_name),
+                texts=np.array(texts),
+                embeddings=np.stack(embeddings),
+            )
+
+    def load(self, path):
+        """Add the embeddings from a file written by `save` to the cache.
+
+        Parameters
+        ----------
+        path : str
+            .npz file to read. It is skipped if it was written by a different sentence
+            encoder, or doesn't record one.
+        """
+        with np.load(path) as data:
+            encoder_name = str(data["encoder_name"]) if "encoder_name" in data else None
+            if encoder_name != self._encoder_name:
+                print(
+                    f"Not loading embedding cache {path}: written by encoder {encoder_name!r},"
+                    f" not {self._encoder_name!r}"
+                )
+                return
+            texts, embeddings = data["texts"].tolist(), data["embeddings"]
+        with self._lock:
+            for text, embedding in zip(texts, embeddings, strict=True):
+                self._cache[text] = embedding
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+
+class BatchingEmbedder:
+    """Sentence embedder that encodes texts from concurrent callers in shared batches.
+
+    Each call blocks until its own text is embedded. A worker thread takes whatever
+    requests are queued (up to `max_batch_size`) and encodes them with one call to
+    `encode_batch`, so agents embedding memories from many threads at once (e.g. while
+    being built in parallel) share forward passes. An uncontended call is encoded alone,
+    without waiting for a batch to fill.
+    """
+
+    def __init__(self, encode_batch, max_batch_size=256):
+        self._encode_batch = encode_batch
+        self._max_batch_size = max_batch_size
+        self._requests = queue.Queue()
+        threading.Thread(target=self._worker, name="embedder", daemon=True).start()
+
+    def _worker(self):
+        while True:
+            batch = [self._requests.get()]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            # agents built in parallel all embed the same shared memories at once, so a batch
+            # often repeats texts: each distinct text is encoded once
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                embeddings = dict(zip(texts, self._encode_batch(texts), strict=True))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for text, future in batch:
+                    future.set_result(embeddings[text])
+
+    def __call__(self, text):
+        """Return the embedding of `text` once the batch it joins is encoded."""
+        future = concurrent.futures.Future()
+        self._requests.put((text, future))
+        return future.result()
+
+
+# event records are appended by one writer thread, so agent threads never wait on file I/O.
+# Items are serialized by the caller and queued as (json line, filename) pairs
+_write_queue: queue.Queue = queue.Queue()
+
+
+def _write_worker():
+    while True:
+        batch = [_write_queue.get()]
+        # coalesce whatever else is already queued into one append per file
+        while True:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        lines_by_file: dict[str, list[str]] = {}
+        for json_str, output_filename in batch:
+            lines_by_file.setdefault(output_filename, []).append(json_str)
+        for output_filename, lines in lines_by_file.items():
+            try:
+                with open(output_filename, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+            except Exception as e:
+                print(f"Error in write_item: {e}")
+        for _ in batch:
+            _write_queue.task_done()
+
+
+threading.Thread(target=_write_worker, name="event-writer", daemon=True).start()
+atexit.register(_write_queue.join)
+
+
+def flush_event_logs():
+    """Block until all queued event records have been written."""
+    _write_queue.join()
+
+
 def write_item(out_item, output_filename):
     try:
-        with file_lock:
-            with open(output_filename, "a") as f:
-                json_str = json.dumps(out_item)  # Separate this step for debugging
-                print(json_str, file=f)
-                print(f"Successfully wrote item with type: {out_item.get('label')}")  # Debug print
+        json_str = json.dumps(out_item)  # Separate this step for debugging
+        _write_queue.put((json_str, output_filename))
     except Exception as e:
         print(f"Error in write_item: {e}")
         print(
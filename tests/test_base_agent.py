@@ -0,0 +1,71 @@
+"""Test saving simulation agents."""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from agent_utils.base_agent import save_agent_to_json
+from concordia.typing import entity_component
+
+
+class _Component:
+    def __init__(self, state):
+        self._state = state
+
+    def get_state(self):
+        return self._state
+
+
+class _Agent:
+    def __init__(self, components, act_state, config):
+        self._components = {name: _Component(state) for name, state in components.items()}
+        self._act_component = _Component(act_state)
+        self._config = config
+
+    def get_phase(self):
+        return entity_component.Phase.READY
+
+    def get_all_context_components(self):
+        return self._components
+
+    def get_component(self, name):
+        return self._components[name]
+
+    def get_act_component(self):
+        return self._act_component
+
+    def get_config(self):
+        return self._config
+
+
+def _dumps_all_at_once(agent) -> str:
+    # save_agent_to_json before it streamed: one dict of every state, then json.dumps
+    data = {
+        name: agent.get_component(name).get_state() for name in agent.get_all_context_components()
+    }
+    data["act_component"] = agent.get_act_component().get_state()
+    config = agent.get_config()
+    if config is not None:
+        data["agent_config"] = config.to_dict()
+    return json.dumps(data)
+
+
+@pytest.mark.parametrize(
+    "config", [None, SimpleNamespace(to_dict=lambda: {"name": "Ann", "traits": "kind"})]
+)
+def test_save_agent_to_json_matches_json_dumps(config) -> None:
+    """Test that the streamed JSON is identical to dumping the collected states at once."""
+    agent = _Agent(
+        {
+            "Observation": {"memories": ["Ann saw a toot", 'quoted "text" é']},
+            "TimeDisplay": {},
+        },
+        act_state={"step": 3, "ratio": 0.5, "flag": None},
+        config=config,
+    )
+    expected = _dumps_all_at_once(agent)
+    assert save_agent_to_json(agent) == expected
+    fp = io.StringIO()
+    assert save_agent_to_json(agent, fp) is None
+    assert fp.getvalue() == expected
@@ -0,0 +1,50 @@
+"""Test the simulation's language model utilities."""
+
+import httpx
+import openai
+import pytest
+from sim_utils import media_utils
+
+
+def _api_error(error_class, status_code):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return error_class("API error", response=response, body=None)
+
+
+class _StubCall:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+
+    def __call__(self):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record backoff sleeps instead of sleeping."""
+    recorded: list[float] = []
+    monkeypatch.setattr(media_utils.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_with_retries_retries_rate_limit(sleeps: list[float]) -> None:
+    """Test that a rate-limited call is retried after a backoff."""
+    call = _StubCall(_api_error(openai.RateLimitError, 429), "answer")
+    assert media_utils._with_retries(call) == "answer"
+    assert not call.outcomes
+    assert len(sleeps) == 1
+
+
+def test_with_retries_raises_bad_request_at_once(sleeps: list[float]) -> None:
+    """Test that a non-transient error is raised without a further retry or backoff."""
+    call = _StubCall(
+        _api_error(openai.RateLimitError, 429), _api_error(openai.BadRequestError, 400)
+    )
+    with pytest.raises(openai.BadRequestError):
+        media_utils._with_retries(call)
+    assert not call.outcomes
+    assert len(sleeps) == 1
@@ -0,0 +1,90 @@
+"""Test the simulation's embedding utilities."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from sim_utils.misc_sim_utils import BatchingEmbedder, CachedEmbedder
+
+
+class _CountingEncoder:
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, text):
+        self.texts.append(text)
+        return np.full(2, float(len(text)))
+
+
+class _FailingEncoder:
+    def __call__(self, text):
+        raise AssertionError(f"{text!r} should have been loaded from the cache file")
+
+
+def _wait_until(condition, timeout=5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_batching_embedder_coalesces_and_dedups() -> None:
+    """Test that texts queued during an encode pass share the next pass, once each."""
+    batches = []
+    release = threading.Event()
+
+    def encode_batch(texts):
+        batches.append(texts)
+        release.wait(timeout=5)
+        return [np.full(2, len(text)) for text in texts]
+
+    embedder = BatchingEmbedder(encode_batch)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(embedder, "a")
+        _wait_until(lambda: len(batches) == 1)
+        # the worker is busy with "a", so these queue up for the next batch
+        queued = [pool.submit(embedder, text) for text in ["bb", "ccc", "bb"]]
+        _wait_until(lambda: embedder._requests.qsize() == len(queued))
+        release.set()
+        assert first.result()[0] == 1
+        assert [future.result()[0] for future in queued] == [2, 3, 2]
+    assert batches == [["a"], ["bb", "ccc"]]
+
+
+def test_cached_embedder_evicts_least_recently_used() -> None:
+    """Test that a full cache evicts the text used least recently."""
+    encoder = _CountingEncoder()
+    embedder = CachedEmbedder(encoder, maxsize=2)
+    for text in ["a", "bb", "a", "ccc"]:  # "bb" is the least recently used when "ccc" comes in
+        embedder(text)
+    assert encoder.texts == ["a", "bb", "ccc"]
+    embedder("a")
+    embedder("bb")
+    assert encoder.texts == ["a", "bb", "ccc", "bb"]
+
+
+def test_cached_embedder_save_load_round_trip(tmp_path: Path) -> None:
+    """Test that embeddings saved by one cache are served by a cache loading the file."""
+    path = str(tmp_path / "embeddings.npz")
+    saved = CachedEmbedder(_CountingEncoder(), path=path, encoder_name="encoder-a")
+    embeddings = {text: saved(text) for text in ["a", "bb"]}
+    saved.save()
+
+    loaded = CachedEmbedder(_FailingEncoder(), path=path, encoder_name="encoder-a")
+    for text, embedding in embeddings.items():
+        np.testing.assert_array_equal(loaded(text), embedding)
+
+
+def test_cached_embedder_rejects_file_from_other_encoder(tmp_path: Path) -> None:
+    """Test that a cache file written by a different sentence encoder is not loaded."""
+    path = str(tmp_path / "embeddings.npz")
+    saved = CachedEmbedder(_CountingEncoder(), path=path, encoder_name="encoder-a")
+    saved("a")
+    saved.save()
+
+    encoder = _CountingEncoder()
+    loaded = CachedEmbedder(encoder, path=path, encoder_name="encoder-b")
+    loaded("a")
+    assert encoder.texts == ["a"]